@@ -2,21 +2,29 @@ from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 
-from .api import YandexIoTClient
+from .api import YandexIoTAuthError, YandexIoTClient, YandexIoTPermissionError
 from .const import DOMAIN, CONF_UPDATE_INTERVAL, PLATFORMS, CONF_TOKEN, CONF_DEVICE_IDS, DEFAULT_UPDATE_INTERVAL
 from .coordinator import YandexClimateCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    session = async_get_clientsession(hass)
     token: str = entry.data[CONF_TOKEN]
     device_ids: list[str] = entry.data.get(CONF_DEVICE_IDS, [])
     interval_s: int = entry.options.get("update_interval", DEFAULT_UPDATE_INTERVAL)
 
-    client = YandexIoTClient(session, token)
-    info = await client.get_user_info()
+    # Client owns a long-lived session so keep-alive persists across polls.
+    client = YandexIoTClient(None, token)
+    # HA runs on-unload callbacks on unload and on setup aborted with the
+    # ConfigEntry* exceptions below, so every path closes the session.
+    entry.async_on_unload(client.close)
+    try:
+        info = await client.get_user_info()
+    except (YandexIoTAuthError, YandexIoTPermissionError) as e:
+        raise ConfigEntryAuthFailed(str(e)) from e
+    except Exception as e:  # noqa: BLE001
+        raise ConfigEntryNotReady(str(e)) from e
     room_map = {r.get('id'): r.get('name') for r in (info.get('rooms') or [])}
     coordinator = YandexClimateCoordinator(hass, client, device_ids, interval_s, room_map)
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
@@ -34,6 +42,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        # Session close is handled by the entry.async_on_unload callback
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return True
 
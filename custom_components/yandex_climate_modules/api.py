@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import YANDEX_IOT_BASE
 
@@ -22,47 +23,95 @@ class YandexIoTPermissionError(YandexIoTApiError):
     """Raised for Yandex IoT API errors."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class YandexDevice:
     id: str
     name: str
     room: str | None
+    room_name: str | None
     properties: list[dict[str, Any]]
 
+    @classmethod
+    def from_payload(
+        cls,
+        payload: dict[str, Any],
+        rooms_map: dict[str, str] | None = None,
+        fallback_id: str | None = None,
+    ) -> YandexDevice:
+        did = payload.get("id") or fallback_id
+        room = payload.get("room")
+        return cls(
+            id=did,
+            name=payload.get("name") or did,
+            room=room,
+            room_name=(rooms_map or {}).get(room),
+            properties=payload.get("properties") or [],
+        )
+
 
 def _normalize_token(token: str) -> str:
     token = (token or "").strip()
-    if token.lower().startswith("bearer "):
-        token = token.split(None, 1)[1].strip()
+    # Case-insensitive prefix check without lowercasing the whole token
+    if len(token) > 7 and token[:7].lower() == "bearer ":
+        token = token[7:].lstrip()
     return token
 
 
 class YandexIoTClient:
-    def __init__(self, session: aiohttp.ClientSession, token: str) -> None:
-        self._session = session
+    def __init__(self, session: aiohttp.ClientSession | None, token: str) -> None:
         self._token = _normalize_token(token)
+        # Own a session with keep-alive tuned for slow polling so connections
+        # (and their TLS handshakes) survive between coordinator updates.
+        self._owns_session = session is None
+        if session is None:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    keepalive_timeout=300,
+                    ttl_dns_cache=600,
+                    enable_cleanup_closed=True,
+                ),
+            )
+        self._session = session
+        # Built once; every request reuses the same dict object.
+        self._auth_headers = {"Authorization": f"Bearer {self._token}"}
 
-    def _headers(self) -> dict[str, str]:
-        return {"Authorization": f"Bearer {self._token}"}
+    async def close(self) -> None:
+        """Close the client-owned session (no-op for a shared one)."""
+        if self._owns_session:
+            await self._session.close()
 
-    async def _get_json(self, path: str) -> dict[str, Any]:
+    async def _request_json(self, method: str, path: str, json: Any = None) -> dict[str, Any]:
         url = f"{YANDEX_IOT_BASE}{path}"
-        async with self._session.get(
+        body = None
+        headers = self._auth_headers
+        if json is not None:
+            body = orjson.dumps(json)
+            headers = {**headers, "Content-Type": "application/json"}
+        async with self._session.request(
+            method,
             url,
-            headers=self._headers(),
+            data=body,
+            headers=headers,
             timeout=aiohttp.ClientTimeout(total=20),
         ) as resp:
-            text = await resp.text()
-            if resp.status == 401:
-                raise YandexIoTAuthError(f"HTTP 401 Unauthorized: {text[:300]}")
-            if resp.status == 403:
-                raise YandexIoTPermissionError(f"HTTP 403 Forbidden: {text[:300]}")
             if resp.status >= 400:
+                # Only the first 512 bytes are needed for the [:300] slice
+                raw = await resp.content.read(512)
+                text = raw.decode("utf-8", "replace")
+                if resp.status == 401:
+                    raise YandexIoTAuthError(f"HTTP 401 Unauthorized: {text[:300]}")
+                if resp.status == 403:
+                    raise YandexIoTPermissionError(f"HTTP 403 Forbidden: {text[:300]}")
                 raise YandexIoTApiError(f"HTTP {resp.status}: {text[:300]}")
             try:
-                return await resp.json()
+                return await resp.json(content_type=None, loads=orjson.loads)
             except Exception as e:  # noqa: BLE001
-                raise YandexIoTApiError(f"Bad JSON: {e}. Body: {text[:300]}") from e
+                raise YandexIoTApiError(f"Bad JSON: {e}") from e
+
+    async def _get_json(self, path: str) -> dict[str, Any]:
+        return await self._request_json("GET", path)
 
     async def get_user_info(self) -> dict[str, Any]:
         data = await self._get_json("/user/info")
@@ -92,21 +141,31 @@ class YandexIoTClient:
                 if did:
                     ids.append(did)
         # unique, preserve order
-        seen: set[str] = set()
-        out: list[str] = []
-        for did in ids:
-            if did not in seen:
-                seen.add(did)
-                out.append(did)
-        return out
-
-    async def get_device(self, device_id: str) -> YandexDevice:
+        return list(dict.fromkeys(ids))
+
+    async def get_devices_states(
+        self, ids: list[str], rooms_map: dict[str, str] | None = None
+    ) -> list[YandexDevice]:
+        """Fetch current states for many devices in a single round trip."""
+        if not ids:
+            return []
+        data = await self._request_json(
+            "POST",
+            "/devices/states",
+            json={"devices": [{"id": did} for did in ids]},
+        )
+        if data.get("status") != "ok":
+            raise YandexIoTApiError(f"Unexpected response: {data}")
+        return [
+            YandexDevice.from_payload(dev, rooms_map)
+            for dev in (data.get("devices") or [])
+            if dev.get("id")
+        ]
+
+    async def get_device(
+        self, device_id: str, rooms_map: dict[str, str] | None = None
+    ) -> YandexDevice:
         data = await self._get_json(f"/devices/{device_id}")
         if data.get("status") != "ok":
             raise YandexIoTApiError(f"Unexpected response: {data}")
-        return YandexDevice(
-            id=data["id"],
-            name=data.get("name") or device_id,
-            room=data.get("room"),
-            properties=data.get("properties") or [],
-        )
+        return YandexDevice.from_payload(data, rooms_map, fallback_id=device_id)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import asyncio
 import logging
 import voluptuous as vol
 
@@ -10,6 +11,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import (
+    YandexDevice,
     YandexIoTClient,
     YandexIoTApiError,
     YandexIoTAuthError,
@@ -28,16 +30,16 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-def _is_climate_module(device: dict[str, Any]) -> bool:
-    props = device.get("properties") or []
-    instances: set[str] = set()
-    for p in props:
+def _is_climate_module(device: YandexDevice) -> bool:
+    # strict match (all 3) to avoid false positives; stop scanning as soon
+    # as every required instance has been seen
+    missing = set(CLIMATE_INSTANCES)
+    for p in device.properties:
         st = p.get("state") or {}
-        inst = st.get("instance")
-        if inst:
-            instances.add(inst)
-    # strict match (all 3) to avoid false positives
-    return CLIMATE_INSTANCES.issubset(instances)
+        missing.discard(st.get("instance"))
+        if not missing:
+            return True
+    return False
 
 
 class YandexClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -62,14 +64,21 @@ class YandexClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 info = await client.get_user_info()
                 room_map = {r.get('id'): r.get('name') for r in (info.get('rooms') or [])}
                 device_ids = await client.list_device_ids()
-                # Fetch each device details to find climate modules
-                devices = []
-                for did in device_ids:
-                    try:
-                        dev = await client.get_device(did)
-                        devices.append({"id": dev.id, "name": dev.name, "room": dev.room, "room_name": room_map.get(dev.room), "properties": dev.properties})
-                    except Exception as e:  # noqa: BLE001
-                        _LOGGER.debug("Failed to fetch device %s: %s", did, e)
+                # Fetch all device details concurrently to find climate
+                # modules, capped at 8 in flight to avoid API rate limits
+                sem = asyncio.Semaphore(8)
+
+                async def _fetch(did: str) -> YandexDevice | None:
+                    async with sem:
+                        try:
+                            return await client.get_device(did, room_map)
+                        except Exception as e:  # noqa: BLE001
+                            _LOGGER.debug("Failed to fetch device %s: %s", did, e)
+                            return None
+
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(_fetch(did)) for did in device_ids]
+                devices = [t.result() for t in tasks if t.result() is not None]
                 climate = [d for d in devices if _is_climate_module(d)]
                 if not climate:
                     errors["base"] = "no_modules_found"
@@ -103,7 +112,7 @@ class YandexClimateConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         def _norm(n: str) -> str:
             return "Климатическая станция" if (n or "").strip().lower() == "умное устройство" else (n or "Модуль")
 
-        options = {d["id"]: f"{_norm(d.get('name'))}" + (f" — {d.get('room_name')}" if d.get('room_name') else "") + f" ({d['id']})" for d in climate}
+        options = {d.id: f"{_norm(d.name)}" + (f" — {d.room_name}" if d.room_name else "") + f" ({d.id})" for d in climate}
 
         if user_input is not None:
             selected = user_input.get(CONF_DEVICE_IDS)
@@ -13,7 +13,7 @@ INST_TEMPERATURE = "temperature"
 INST_HUMIDITY = "humidity"
 INST_CO2 = "co2_level"
 
-CLIMATE_INSTANCES = {INST_TEMPERATURE, INST_HUMIDITY, INST_CO2}
+CLIMATE_INSTANCES = frozenset({INST_TEMPERATURE, INST_HUMIDITY, INST_CO2})
 
 
 # Options
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import timedelta
 from typing import Any
@@ -34,19 +33,49 @@ class YandexClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._client = client
         self.device_ids = device_ids
         self._room_map = room_map or {}
+        # Adaptive polling: back off while device telemetry is idle,
+        # snap back to the configured interval as soon as it moves.
+        self._base_interval = timedelta(seconds=interval_s or DEFAULT_UPDATE_INTERVAL)
+        self._max_interval = self._base_interval * 8
+        self._last_seen_ts: float | None = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         try:
-            tasks = [self._client.get_device(did) for did in self.device_ids]
-            devices = await asyncio.gather(*tasks)
+            devices = await self._client.get_devices_states(self.device_ids, self._room_map)
             out: dict[str, Any] = {}
             for dev in devices:
+                # Index and aggregate once per poll so sensors avoid a
+                # linear scan per read.
+                by_instance: dict[str, Any] = {}
+                latest: float | None = None
+                for p in dev.properties:
+                    inst = (p.get("state") or {}).get("instance")
+                    if inst:
+                        by_instance[inst] = p
+                    lu = p.get("last_updated")
+                    if isinstance(lu, (int, float)) and (latest is None or lu > latest):
+                        latest = float(lu)
                 out[dev.id] = {
                     "name": dev.name,
                     "room": dev.room,
-                    "room_name": self._room_map.get(dev.room),
+                    "room_name": dev.room_name,
                     "properties": dev.properties,
+                    "by_instance": by_instance,
+                    "last_updated": latest,
                 }
+            self._adjust_interval(out)
             return out
         except Exception as e:  # noqa: BLE001
             raise UpdateFailed(str(e)) from e
+
+    def _adjust_interval(self, data: dict[str, Any]) -> None:
+        latest: float | None = None
+        for payload in data.values():
+            lu = payload["last_updated"]
+            if lu is not None and (latest is None or lu > latest):
+                latest = lu
+        if latest is not None and latest == self._last_seen_ts:
+            self.update_interval = min(self.update_interval * 1.5, self._max_interval)
+        else:
+            self._last_seen_ts = latest
+            self.update_interval = self._base_interval
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -23,13 +22,9 @@ INST_TO_META: dict[str, tuple[str, str, SensorDeviceClass | None]] = {
 }
 
 
-@dataclass(frozen=True)
-class DerivedKind:
-    key: str
-    name_suffix: str
-
-
-DER_LAST_UPDATED = DerivedKind("last_updated", "Last Updated")
+# Shared read-only fallback so the `or {}` pattern does not allocate
+# a throwaway dict on every property read
+_EMPTY: dict[str, Any] = {}
 
 
 def _normalize_device_name(name: str) -> str:
@@ -38,21 +33,24 @@ def _normalize_device_name(name: str) -> str:
     return name
 
 
-def _find_prop(properties: list[dict[str, Any]], instance: str) -> dict[str, Any] | None:
-    for p in properties:
-        st = p.get("state") or {}
-        if st.get("instance") == instance:
-            return p
-    return None
+def _round1(v: Any) -> float:
+    return round(float(v), 1)
+
+
+def _round0_int(v: Any) -> int:
+    return int(round(float(v), 0))
 
 
-def _last_updated_max(properties: list[dict[str, Any]]) -> float | None:
-    vals: list[float] = []
-    for p in properties:
-        lu = p.get("last_updated")
-        if isinstance(lu, (int, float)):
-            vals.append(float(lu))
-    return max(vals) if vals else None
+def _passthru(v: Any) -> Any:
+    return v
+
+
+# Value converter per instance, bound once at entity construction
+_INST_TO_CONVERT = {
+    INST_TEMPERATURE: _round1,
+    INST_HUMIDITY: _round1,
+    INST_CO2: _round0_int,
+}
 
 
 async def async_setup_entry(
@@ -74,7 +72,7 @@ async def async_setup_entry(
 
         # Diagnostic timestamp (last updated)
         if enable_last:
-            entities.append(YandexClimateDerivedSensor(coordinator, did, DER_LAST_UPDATED))
+            entities.append(YandexLastUpdatedSensor(coordinator, did))
 
     async_add_entities(entities)
 
@@ -82,29 +80,45 @@ async def async_setup_entry(
 class YandexClimateBase(SensorEntity):
     """Base class for all sensors in this integration."""
 
+    # _attr_* names stay unslotted: HA's Entity gives them class-level
+    # defaults that a slot descriptor would shadow.
+    __slots__ = ("coordinator", "device_id", "_tail", "_name_key", "_cached_display")
+
     _attr_should_poll = False
 
     def __init__(self, coordinator, device_id: str) -> None:
         self.coordinator = coordinator
         self.device_id = device_id
+        self._tail = device_id[-5:]
+        self._name_key: tuple[Any, Any] | None = None
+        self._cached_display = ""
+
+    def _display_name(self) -> str:
+        """Device display name, recomputed only when name/room change."""
+        payload = self._device_payload
+        key = (payload.get("name"), payload.get("room_name"))
+        if key != self._name_key:
+            base = _normalize_device_name(key[0] or "Yandex Climate Module")
+            room = key[1]
+            self._name_key = key
+            self._cached_display = (
+                f"{base} {room} ({self._tail})" if room else f"{base} ({self._tail})"
+            )
+        return self._cached_display
 
     @property
     def available(self) -> bool:
-        return self.device_id in (self.coordinator.data or {})
+        return self.device_id in (self.coordinator.data or _EMPTY)
 
     @property
     def _device_payload(self) -> dict[str, Any]:
-        return (self.coordinator.data or {}).get(self.device_id, {})
+        return (self.coordinator.data or _EMPTY).get(self.device_id, _EMPTY)
 
     @property
     def device_info(self):
-        base = _normalize_device_name(self._device_payload.get("name") or "Yandex Climate Module")
-        room = self._device_payload.get("room_name")
-        tail = self.device_id[-5:]
-        name = f"{base} {room} ({tail})" if room else f"{base} ({tail})"
         return {
             "identifiers": {(DOMAIN, self.device_id)},
-            "name": name,
+            "name": self._display_name(),
             "manufacturer": "Yandex",
             "model": "Climate module (IoT API)",
         }
@@ -114,22 +128,21 @@ class YandexClimateBase(SensorEntity):
 
 
 class YandexClimateSensor(YandexClimateBase):
+    __slots__ = ("instance", "_title", "_convert")
+
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def name(self) -> str:
-        base = _normalize_device_name(self._device_payload.get("name") or "Yandex Climate Module")
-        room = self._device_payload.get("room_name")
-        tail = self.device_id[-5:]
-        device_name = f"{base} {room} ({tail})" if room else f"{base} ({tail})"
-        title, _, _ = INST_TO_META[self.instance]
-        return f"{device_name} {title}"
+        return f"{self._display_name()} {self._title}"
 
     def __init__(self, coordinator, device_id: str, instance: str) -> None:
         super().__init__(coordinator, device_id)
         self.instance = instance
 
         title, unit, dev_class = INST_TO_META[instance]
+        self._title = title
+        self._convert = _INST_TO_CONVERT.get(instance, _passthru)
         self._attr_unique_id = f"{device_id}_{instance}"
         self._attr_native_unit_of_measurement = unit
         if dev_class:
@@ -139,50 +152,41 @@ class YandexClimateSensor(YandexClimateBase):
 
     @property
     def native_value(self):
-        props = self._device_payload.get("properties") or []
-        p = _find_prop(props, self.instance)
+        p = (self._device_payload.get("by_instance") or _EMPTY).get(self.instance)
         if not p:
             return None
         val = (p.get("state") or {}).get("value")
         if val is None:
             return None
+        return self._convert(val)
 
-        if self.instance in (INST_TEMPERATURE, INST_HUMIDITY):
-            return round(float(val), 1)
-        if self.instance == INST_CO2:
-            return int(round(float(val), 0))
-        return val
 
+class YandexLastUpdatedSensor(YandexClimateBase):
+    """Diagnostic timestamp of the freshest device property."""
 
-class YandexClimateDerivedSensor(YandexClimateBase):
-    """Diagnostic sensors derived from Yandex device properties."""
+    __slots__ = ("_last_ts", "_last_dt")
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_state_class = None
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
     def name(self) -> str:
-        base = _normalize_device_name(self._device_payload.get("name") or "Yandex Climate Module")
-        room = self._device_payload.get("room_name")
-        tail = self.device_id[-5:]
-        device_name = f"{base} {room} ({tail})" if room else f"{base} ({tail})"
-        return f"{device_name} {self.kind.name_suffix}"
+        return f"{self._display_name()} Last Updated"
 
-    def __init__(self, coordinator, device_id: str, kind: DerivedKind) -> None:
+    def __init__(self, coordinator, device_id: str) -> None:
         super().__init__(coordinator, device_id)
-        self.kind = kind
-        self._attr_unique_id = f"{device_id}_{kind.key}"
-
-        if kind.key == "last_updated":
-            self._attr_device_class = SensorDeviceClass.TIMESTAMP
-            self._attr_state_class = None
-            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = f"{device_id}_last_updated"
+        self._last_ts: float | None = None
+        self._last_dt: datetime | None = None
 
     @property
     def native_value(self):
-        props = self._device_payload.get("properties") or []
-        ts = _last_updated_max(props)
+        ts = self._device_payload.get("last_updated")
         if ts is None:
             return None
-
-        if self.kind.key == "last_updated":
-            return datetime.fromtimestamp(ts, tz=timezone.utc)
-
-        return None
+        # Convert only when the timestamp actually moved
+        if ts != self._last_ts:
+            self._last_ts = ts
+            self._last_dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+        return self._last_dt